@@ -1,9 +1,12 @@
+import operator
+import os
 import sys
 import warnings
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from typing import TextIO
-from . import biblib, inputfiles
+from . import biblib
 
 # default macros:
 # - turn month names into numeric values
@@ -65,20 +68,67 @@ def handle_warnings() -> Iterator[None]:
 
 
 @handle_warnings()
-def main() -> int:
-    # iterate all input files or stdin
-    for file in inputfiles.files(None, True, ".untidy"):
-        # load current BibTeX file from string
-        bib = biblib.load(file, macros=MACROS, warn_macros=False)
+def tidy(filename: str) -> None:
+    """Tidy up a single BibTeX file, or stdin for "-", in place."""
+
+    # read the whole input, so that the result can be compared to it
+    if filename == "-":
+        data = sys.stdin.read()
+    else:
+        with open(filename) as fp:
+            data = fp.read()
+
+    # load BibTeX data from string
+    bib = biblib.loads(
+        data,
+        None if filename == "-" else filename,
+        macros=MACROS,
+        warn_macros=False,
+    )
 
-        # sort entries by year in reverse order
-        entries = dict(sorted(bib.entries.items(), key=sortkey_year, reverse=True))
+    # sort entries by year in reverse order, computing each sort key
+    # only once instead of on every comparison
+    decorated = [(sortkey_year(item), item) for item in bib.entries.items()]
+    decorated.sort(key=operator.itemgetter(0), reverse=True)
+    entries = dict(item for _, item in decorated)
+
+    # repack the bib tuple with the sorted entries
+    bib = bib._replace(entries=entries)
+
+    # format BibTeX in standard form
+    tidied = biblib.dumps(bib)
+    if tidied:
+        tidied += "\n"
+
+    if filename == "-":
+        # stdin is always formatted to stdout
+        sys.stdout.write(tidied)
+    elif tidied != data:
+        # keep the original contents as a backup, then rewrite the file
+        # with the same permissions; files that are already tidy are
+        # left completely untouched
+        perm = os.stat(filename).st_mode
+        os.replace(filename, filename + ".untidy")
+        with open(filename, "w") as fp:
+            fp.write(tidied)
+        try:
+            os.chmod(filename, perm)
+        except OSError:
+            pass
 
-        # repack the bib tuple with the sorted entries
-        bib = bib._replace(entries=entries)
 
-        # output BibTeX in standard form to stdout, which points to file
-        biblib.dump(sys.stdout, bib)
+def main() -> int:
+    # tidy up all input files, or stdin if no files are given
+    filenames = sys.argv[1:] or ["-"]
+
+    if len(filenames) > 1 and "-" not in filenames:
+        # files are independent of one another, so they can be tidied
+        # up in parallel; stdin always stays on the main process
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(tidy, filenames))
+    else:
+        for filename in filenames:
+            tidy(filename)
 
     # all done
     return 0
@@ -30,6 +30,7 @@ parser.
 
 """
 
+import functools
 import re
 import warnings
 from collections.abc import Mapping
@@ -47,6 +48,31 @@ ID_RE = re.compile("(?![0-9])(?:(?![ \t\"#%'(),={}])[\x20-\x7f])+")
 # lex_class)
 SPACE_RE = re.compile("[ \t\n]*")
 
+# Character map that turns tabs and newlines into spaces (see SPACE_RE)
+SPACE_TRANS = str.maketrans("\t\n", "  ")
+
+# Fused patterns for the hot token sequences, so that a single regex
+# match replaces several token-at-a-time scans with white space in
+# between (see _scan_command_or_entry)
+COMMAND_RE = re.compile(f"@[ \t\n]*({ID_RE.pattern})[ \t\n]*")
+FIELD_RE = re.compile(f",[ \t\n]*({ID_RE.pattern})[ \t\n]*=[ \t\n]*")
+
+# Pre-compiled patterns for the individual tokens, so that no call site
+# pays a re.compile cache lookup in the parsing hot path
+NOISE_RE = re.compile("[^@]*")
+AT_RE = re.compile("@")
+OPEN_RE = re.compile("[{(]")
+KEY_PAREN_RE = re.compile("[^, \t\n]*")
+KEY_BRACE_RE = re.compile("[^, \t}\n]*")
+COMMA_RE = re.compile(",")
+EQUALS_RE = re.compile("=")
+NUMBER_RE = re.compile("[0-9]+")
+HASH_RE = re.compile("#")
+BALANCED_BRACE_RE = re.compile("[{}]")
+BALANCED_QUOTE_RE = re.compile('[{}"]')
+RBRACE_RE = re.compile("}")
+RPAREN_RE = re.compile("\\)")
+
 
 class BibtexError(ValueError):
     """Exception raised for BibTeX parsing errors."""
@@ -68,6 +94,18 @@ class BibtexMacro(str):
         return self
 
 
+@functools.lru_cache(maxsize=4096)
+def _macro(name: str, value: str) -> BibtexMacro:
+    """Return a shared BibtexMacro instance for *name* and *value*.
+
+    Macro names repeat heavily (months, journal abbreviations), so the
+    instances are cached and shared across references and documents.
+    Keying on the value as well keeps redefined macros correct.
+
+    """
+    return BibtexMacro(name, value)
+
+
 class BibtexComment(NamedTuple):
     """Container for BibTeX comment commands.
 
@@ -76,6 +114,10 @@ class BibtexComment(NamedTuple):
     """
 
 
+# the one BibtexComment instance, since it carries no data
+_COMMENT = BibtexComment()
+
+
 class BibtexPreamble(NamedTuple):
     """Container for BibTeX preamble commands."""
 
@@ -94,7 +136,7 @@ class BibtexEntry(NamedTuple):
 
     entry_type: str
     key: str
-    fields: dict[str, str | BibtexMacro]
+    fields: "BibtexFields"
 
 
 #: Type alias for the possible content types in a BibTeX file.
@@ -110,17 +152,14 @@ def _msg_with_context(
 ) -> str:
     """Add parsing context to an error or warning message."""
     if start is None:
-        start = stop
-        while start > 0 and stop - start < context:
-            start -= 1
-            if data[start] == "\n":
-                start += 1
-                break
+        # walk back to the start of the line, at most *context* chars,
+        # using the C-level reverse search instead of a character loop
+        nl = data.rfind("\n", max(0, stop - context), stop)
+        start = nl + 1 if nl >= 0 else max(0, stop - context)
     if start == stop:
-        while stop < len(data) and stop - start < context:
-            stop += 1
-            if data[stop : stop + 1] == "\n":
-                break
+        # extend forward to the end of the line, at most *context* chars
+        nl = data.find("\n", start + 1, start + context)
+        stop = nl if nl >= 0 else min(len(data), start + context)
     if stop > start:
         msg = f"{msg}: {data[start : stop]}"
     return msg
@@ -133,9 +172,12 @@ class BibtexParser:
         # used for warnings
         self.filename = filename
 
-        # Remove trailing whitespace from lines in data (see input_ln
-        # in bibtex.web)
-        self.data = re.sub("[ \t]+$", "", data, flags=re.MULTILINE)
+        # Unlike bibtex (see input_ln in bibtex.web), trailing white
+        # space is not stripped from lines up front: field values are
+        # white-space normalised in _scan_field_value, and no other
+        # token can contain white space, so the full-size copy of the
+        # input that the substitution would make is never needed
+        self.data = data
 
         # these will be set in parse()
         self.off = 0
@@ -169,19 +211,22 @@ class BibtexParser:
         # This is equivalent to eat_bib_white_space, except that we do
         # it automatically after every token, whereas bibtex carefully
         # and explicitly does it between every token.
-        if m := SPACE_RE.match(self.data, self.off):
+        # Most tokens are not followed by white space, so peek at the
+        # next character before entering the regex engine
+        data, off = self.data, self.off
+        if data[off : off + 1] not in " \t\n":
+            return
+        if m := SPACE_RE.match(data, off):
             self.off = m.end()
 
     def _try_tok(
         self,
-        regexp: re.Pattern[str] | str,
+        regexp: re.Pattern[str],
         skip_space: bool = True,
     ) -> str | None:
         """Scan regexp followed by white space.
 
         Returns the matched text, or None if the match failed."""
-        if isinstance(regexp, str):
-            regexp = re.compile(regexp)
         m = regexp.match(self.data, self.off)
         if m is None:
             return None
@@ -192,12 +237,18 @@ class BibtexParser:
 
     def _scan_balanced_text(self, term: str) -> str:
         """Scan brace-balanced text terminated with character term."""
-        start, level = self.off, 0
-        while not self._eof:
-            char = self.data[self.off]
+        # Jump from brace to brace (or terminator) with one character-
+        # class search per hop, so that the characters in between are
+        # skipped at C speed instead of one Python iteration each
+        search = (BALANCED_BRACE_RE if term == "}" else BALANCED_QUOTE_RE).search
+        data, start, level = self.data, self.off, 0
+        off = start
+        while m := search(data, off):
+            off = m.start()
+            char = data[off]
             if level == 0 and char == term:
-                text = self.data[start : self.off]
-                self.off += 1
+                text = data[start:off]
+                self.off = off + 1
                 self._skip_space()
                 return text
             elif char == "{":
@@ -205,13 +256,15 @@ class BibtexParser:
             elif char == "}":
                 level -= 1
                 if level < 0:
+                    self.off = off
                     self._fail("unexpected }", start)
-            self.off += 1
+            off += 1
+        self.off = len(data)
         self._fail("unterminated string", start)
 
     def _tok(
         self,
-        regexp: re.Pattern[str] | str,
+        regexp: re.Pattern[str],
         fail: str,
     ) -> str:
         """Scan token regexp or fail with the given message."""
@@ -227,23 +280,34 @@ class BibtexParser:
     def _scan_command_or_entry(self) -> None | BibtexContent:
         # See get_bib_command_or_entry_and_process
 
-        # Skip to the next database entry or command
-        self._tok("[^@]*", "unexpected end of file")
+        # Skip to the next database entry or command (the noise pattern
+        # always matches, possibly empty, so this cannot fail)
+        if m := NOISE_RE.match(self.data, self.off):
+            self.off = m.end()
         self.good = self.off
-        if self._try_tok("@") is None:
+
+        # nothing left to scan at end of file
+        if self._eof:
             return None
 
-        # Scan command or entry type
-        typ = self._scan_identifier()
+        # Scan @ and the command or entry type in a single match; fall
+        # back to token-at-a-time scanning for EOF and error reporting
+        if m := COMMAND_RE.match(self.data, self.off):
+            self.off = m.end()
+            typ = m.group(1).lower()
+        else:
+            if self._try_tok(AT_RE) is None:
+                return None
+            typ = self._scan_identifier()
 
         if typ == "comment":
             # Believe it or not, BibTeX doesn't do anything with what
             # comes after an @comment, treating it like any other
             # inter-entry noise.
-            return BibtexComment()
+            return _COMMENT
 
-        left = self._tok("[{(]", "expected { or ( after entry type")
-        right, right_re = (")", "\\)") if left == "(" else ("}", "}")
+        left = self._tok(OPEN_RE, "expected { or ( after entry type")
+        right, right_re = (")", RPAREN_RE) if left == "(" else ("}", RBRACE_RE)
 
         if typ == "preamble":
             # Parse the preamble, and return it without key
@@ -254,7 +318,7 @@ class BibtexParser:
         if typ == "string":
             # Parse the macro, store it, and return its value
             name = self._scan_identifier()
-            self._tok("=", "expected = after string name")
+            self._tok(EQUALS_RE, "expected = after string name")
             value = self._scan_field_value()
             self._tok(right_re, f"expected {right}")
             if name in self.macros:
@@ -269,28 +333,43 @@ class BibtexParser:
             # The database key is anything up to a comma, white
             # space, or end-of-line (yes, the key can be empty,
             # and it can include a close paren)
-            key = self._tok("[^, \t\n]*", "missing key")
+            key = self._tok(KEY_PAREN_RE, "missing key")
         else:
             # The database key is anything up to comma, white
             # space, right brace, or end-of-line
-            key = self._tok("[^, \t}\n]*", "missing key")
-
-        # Scan fields (starting with comma or close after key)
-        fields: dict[str, str | BibtexMacro] = {}
+            key = self._tok(KEY_BRACE_RE, "missing key")
+
+        # Scan fields (starting with comma or close after key); the
+        # close delimiter is a single character, so it is compared
+        # directly instead of going through the regex engine.  The
+        # fields go straight into the BibtexFields dict that the
+        # high-level API stores, so no copy is made later
+        data = self.data
+        fields = BibtexFields(typ)
         while True:
-            if self._try_tok(right_re, skip_space=False) is not None:
-                break
-            self._tok(",", f"expected {right} or ,")
-            if self._try_tok(right_re, skip_space=False) is not None:
+            if data[self.off : self.off + 1] == right:
+                self.off += 1
                 break
-
-            if self._eof:
-                self._fail("input ended prematurely")
-
-            # Scan field name and value
-            field_off = self.off
-            field = self._scan_identifier()
-            self._tok("=", "expected = after field name")
+            # Scan comma, field name, and equals sign in a single
+            # match; fall back to token-at-a-time scanning for trailing
+            # commas and error reporting
+            if m := FIELD_RE.match(data, self.off):
+                field_off = m.start(1)
+                field = m.group(1).lower()
+                self.off = m.end()
+            else:
+                self._tok(COMMA_RE, f"expected {right} or ,")
+                if data[self.off : self.off + 1] == right:
+                    self.off += 1
+                    break
+
+                if self._eof:
+                    self._fail("input ended prematurely")
+
+                # Scan field name and value
+                field_off = self.off
+                field = self._scan_identifier()
+                self._tok(EQUALS_RE, "expected = after field name")
             value = self._scan_field_value()
 
             if field in fields:
@@ -303,32 +382,49 @@ class BibtexParser:
 
     def _scan_field_value(self) -> str | BibtexMacro:
         # See scan_and_store_the_field_value_and_eat_white
-        value = self._scan_field_piece()
-        while self._try_tok("#") is not None:
-            value += self._scan_field_piece()
+        value: str = self._scan_field_piece()
         # Store if value is a macro, so that it can become one again below
-        macro: str | None = getattr(value, "macro", None)
-        # Compress spaces in the text.  Bibtex does this
-        # (painstakingly) as it goes, but the final effect is the same
-        # (see check_for_and_compress_bib_white_space).
-        value = re.sub("[ \t\n]+", " ", value)
-        # Strip leading and trailing space (literally just space, see
-        # @<Store the field value string@>)
-        value = value.strip(" ")
-        # Turn value back into a macro if necessary
+        macro = value.macro if isinstance(value, BibtexMacro) else None
+        if self._try_tok(HASH_RE) is not None:
+            # Concatenation produces a plain string, never a macro;
+            # collect the pieces and join them once
+            macro = None
+            pieces = [value]
+            while True:
+                pieces.append(self._scan_field_piece())
+                if self._try_tok(HASH_RE) is None:
+                    break
+            value = "".join(pieces)
+        # Compress white space in the text and strip it from the edges.
+        # Bibtex does this (painstakingly) as it goes, but the final
+        # effect is the same (see
+        # check_for_and_compress_bib_white_space and @<Store the field
+        # value string@>).  Mapping tabs and newlines to spaces and
+        # splitting on single spaces keeps everything in the C string
+        # routines, instead of going through the regex engine
+        normalized = " ".join(filter(None, value.translate(SPACE_TRANS).split(" ")))
+        # Turn value back into a macro if necessary, keeping the shared
+        # instance when normalisation changed nothing
         if macro is not None:
-            value = BibtexMacro(macro, value)
-        return value
+            if normalized == value:
+                return value
+            return BibtexMacro(macro, normalized)
+        return normalized
 
     def _scan_field_piece(self) -> str | BibtexMacro:
         # See scan_a_field_token_and_eat_white
-        piece = self._try_tok("[0-9]+")
-        if piece is not None:
-            return piece
-        if self._try_tok("{", skip_space=False) is not None:
+        # The first character determines the kind of piece, so a single
+        # peek selects the branch instead of trying up to four patterns
+        # in sequence
+        char = self.data[self.off : self.off + 1]
+        if char == "{":
+            self.off += 1
             return self._scan_balanced_text("}")
-        if self._try_tok('"', skip_space=False) is not None:
+        if char == '"':
+            self.off += 1
             return self._scan_balanced_text('"')
+        if "0" <= char <= "9":
+            return self._tok(NUMBER_RE, "expected number")
         piece = self._try_tok(ID_RE)
         if piece is not None:
             try:
@@ -337,7 +433,7 @@ class BibtexParser:
                 if self.warn_macros:
                     self._warn(f"unknown macro `{piece}'")
                 value = ""
-            return BibtexMacro(piece, value)
+            return _macro(piece, value)
         self._fail("expected string, number, or macro name")
 
     def iterparse(
@@ -347,16 +443,20 @@ class BibtexParser:
     ) -> Iterator[BibtexContent]:
         """Parse BibTeX."""
 
-        # mutable macros dict that is updated with @string definitions
-        self.macros = {**macros}
+        # mutable macros dict that is updated with @string definitions;
+        # the common empty default needs no copy at all
+        self.macros = dict(macros) if macros else {}
         self.warn_macros = warn_macros
 
         # reset state
         self.off = self.good = 0
 
-        # get content until None is returned, which signals EOF
-        content: Iterator[BibtexContent] = iter(self._scan_command_or_entry, None)
-        yield from content
+        # get content until None is returned, which signals EOF; the
+        # method is bound once and called directly, without the
+        # callable-iterator indirection of iter(..., None)
+        scan = self._scan_command_or_entry
+        while (item := scan()) is not None:
+            yield item
 
 
 ## HIGH-LEVEL API ######################################################
@@ -387,18 +487,32 @@ ORDER = [
     "adsnote",
 ]
 
+# Position of each field in the default order, for O(1) lookup
+ORDER_INDEX = {field: index for index, field in enumerate(ORDER)}
+
+# Cache of right-justified field names for formatting
+_PAD_CACHE: dict[str, str] = {}
+
+
+def _pad_field(field: str) -> str:
+    """Return *field* right-justified to the output column width."""
+    padded = _PAD_CACHE.get(field)
+    if padded is None:
+        padded = _PAD_CACHE[field] = f"{field:>13}"
+    return padded
+
 
 def _order_fields(field: str) -> tuple[int, str]:
     """Return the order of field items."""
-    try:
-        return (ORDER.index(field), field)
-    except ValueError:
-        return (len(ORDER), field)
+    return (ORDER_INDEX.get(field, len(ORDER)), field)
 
 
 class BibtexFields(dict[str, str | BibtexMacro]):
     """Dictionary class with an *entry_type* attribute."""
 
+    # no instance __dict__, the dict base provides the storage
+    __slots__ = ("entry_type", "_fmt_cache")
+
     def __init__(
         self,
         entry_type: str,
@@ -407,8 +521,65 @@ class BibtexFields(dict[str, str | BibtexMacro]):
         **fields: str,
     ) -> None:
         self.entry_type = entry_type
-        args = () if data is None else (data,)
-        super().__init__(*args, **fields)
+        self._fmt_cache: tuple[str, str, str] | None = None
+        super().__init__(data or (), **fields)
+
+    # any mutation invalidates the cached formatting
+
+    def __setitem__(self, field: str, value: str | BibtexMacro) -> None:
+        self._fmt_cache = None
+        super().__setitem__(field, value)
+
+    def __delitem__(self, field: str) -> None:
+        self._fmt_cache = None
+        super().__delitem__(field)
+
+    def clear(self) -> None:
+        self._fmt_cache = None
+        super().clear()
+
+    def pop(  # type: ignore[override]
+        self,
+        field: str,
+        /,
+        *default: str | BibtexMacro,
+    ) -> str | BibtexMacro:
+        self._fmt_cache = None
+        return super().pop(field, *default)
+
+    def popitem(self) -> tuple[str, str | BibtexMacro]:
+        self._fmt_cache = None
+        return super().popitem()
+
+    def setdefault(
+        self,
+        field: str,
+        default: str | BibtexMacro = "",
+        /,
+    ) -> str | BibtexMacro:
+        self._fmt_cache = None
+        return super().setdefault(field, default)
+
+    def update(  # type: ignore[override]
+        self,
+        data: Mapping[str, str] | None = None,
+        /,
+        **fields: str,
+    ) -> None:
+        self._fmt_cache = None
+        if data is None:
+            super().update(**fields)
+        else:
+            super().update(data, **fields)
+
+    def __ior__(  # type: ignore[override, misc]
+        self,
+        other: Mapping[str, str | BibtexMacro],
+        /,
+    ) -> "BibtexFields":
+        self._fmt_cache = None
+        super().update(other)
+        return self
 
     def __repr__(self) -> str:
         name = self.__class__.__name__
@@ -422,27 +593,35 @@ class BibtexFields(dict[str, str | BibtexMacro]):
     def __format__(self, key: str) -> str:
         """Format entry in standard form using *key*."""
 
-        out = f"@{self.entry_type.upper()}{{{key}"
+        # return the cached rendering if the entry has not changed
+        cache = self._fmt_cache
+        if cache is not None and cache[0] == key and cache[1] == self.entry_type:
+            return cache[2]
+
+        parts = [f"@{self.entry_type.upper()}{{{key}"]
         if len(self) == 0:
-            out += "}"
+            parts.append("}")
         else:
+            pretty = PRETTY.get
             for field in sorted(self, key=_order_fields):
                 value = self[field]
-                field = PRETTY.get(field, field)
-                if macro := getattr(value, "macro", None):
-                    value = macro
+                field = pretty(field, field)
+                if isinstance(value, BibtexMacro):
+                    value = value.macro
                 else:
                     if field == "title":
                         if value and value[0] == "{" and value[-1] == "}":
-                            value = '"' + value + '"'
+                            value = f'"{value}"'
                         else:
-                            value = '"{' + value + '}"'
+                            value = f'"{{{value}}}"'
                     elif field == "year" and value.isdigit():
                         pass
                     else:
-                        value = "{" + value + "}"
-                out += f",\n{field:>13} = {value}"
-            out += "\n}"
+                        value = f"{{{value}}}"
+                parts.append(f",\n{_pad_field(field)} = {value}")
+            parts.append("\n}")
+        out = "".join(parts)
+        self._fmt_cache = (key, self.entry_type, out)
         return out
 
 
@@ -480,6 +659,9 @@ def load(
         data = data_or_bytes.decode()
     else:
         raise TypeError("read() returned invalid data")
+    # drop the extra reference (for binary input, the whole undecoded
+    # file) before parsing, so peak memory is a single copy of the data
+    del data_or_bytes
     try:
         filename = fp.name
     except AttributeError:
@@ -497,9 +679,16 @@ def loads(
 ) -> BibtexData:
     """Parse BibTeX from a string."""
 
-    # the contents of the BibTeX database
+    # empty input needs no parser at all
+    if not data or data.isspace():
+        return BibtexData([], {}, {})
+
+    # the contents of the BibTeX database; strings are accumulated as a
+    # list so that their dict is built in a single construction, while
+    # entries grow incrementally so that repeated keys are caught (and
+    # warned about with context) as they are parsed
     preamble: list[str] = []
-    strings: dict[str, str] = {}
+    strings: list[tuple[str, str]] = []
     entries: dict[str, BibtexFields] = {}
 
     # create a parser
@@ -515,13 +704,13 @@ def loads(
         elif isinstance(item, BibtexPreamble):
             preamble.append(item.preamble)
         elif isinstance(item, BibtexString):
-            strings[item.name] = item.value
+            strings.append((item.name, item.value))
         else:
             if item.key in entries:
                 parser._warn(f"repeated entry `{item.key}'")
-            entries[item.key] = BibtexFields(item.entry_type, item.fields)
+            entries[item.key] = item.fields
 
-    return BibtexData(preamble, strings, entries)
+    return BibtexData(preamble, dict(strings), entries)
 
 
 def iterdump(bib: BibtexData, /) -> Iterator[str]:
@@ -545,8 +734,10 @@ def iterdump(bib: BibtexData, /) -> Iterator[str]:
 def dump(fp: TextIO, bib: BibtexData, /) -> None:
     """Write formatted BibTeX data to a text file object."""
 
-    for line in iterdump(bib):
-        fp.write(line + "\n")
+    # format everything in memory first, so that the file object sees a
+    # single write and hence a single pass through its encoding path
+    if out := dumps(bib):
+        fp.write(out + "\n")
 
 
 def dumps(bib: BibtexData, /) -> str: